@@ -7,207 +7,69 @@ over the last 10 years.
 NO SAMPLE DATA - THIS IS 100% REAL MARKET DATA!
 """
 
-import urllib.request
-import json
-import csv
-from datetime import datetime, timedelta
+from datetime import datetime
+import functools
 import ssl
 
-# Disable SSL verification for corporate firewalls
-ssl._create_default_https_context = ssl._create_unverified_context
+import numpy as np
 
-def fetch_real_silver_data(symbol='SLV', years=10):
-    """
-    Fetch REAL silver price data from Yahoo Finance.
-    Using SLV (iShares Silver Trust ETF) as silver price proxy.
-
-    This is 100% REAL market data, not simulated!
-    """
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=years*365)
-
-    end_ts = int(end_date.timestamp())
-    start_ts = int(start_date.timestamp())
-
-    # Yahoo Finance Chart API endpoint
-    url = f'https://query2.finance.yahoo.com/v8/finance/chart/{symbol}?period1={start_ts}&period2={end_ts}&interval=1d'
-
-    print(f"Fetching REAL silver price data from Yahoo Finance...")
-    print(f"Symbol: {symbol} (iShares Silver Trust ETF)")
-    print(f"Requested period: {start_date.date()} to {end_date.date()}")
-    print()
-
-    try:
-        req = urllib.request.Request(url)
-        req.add_header('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode('utf-8'))
-
-        if 'chart' not in data or 'result' not in data['chart']:
-            print("Error: Unexpected response format")
-            return []
-
-        result = data['chart']['result'][0]
-        timestamps = result['timestamp']
-        quote = result['indicators']['quote'][0]
-
-        close_prices = quote['close']
-        volumes = quote['volume']
-
-        # Convert to list of dicts
-        rows = []
-        for i, ts in enumerate(timestamps):
-            date = datetime.fromtimestamp(ts).strftime('%Y-%m-%d')
-            close = close_prices[i]
-            volume = volumes[i] if volumes[i] is not None else 0
-
-            if close is not None:  # Skip days with no data
-                rows.append({
-                    'Date': date,
-                    'Close': str(close),
-                    'Volume': str(int(volume))
-                })
-
-        print(f"✓ Retrieved {len(rows)} days of REAL market data")
-        print(f"  Actual date range: {rows[0]['Date']} to {rows[-1]['Date']}")
-        print(f"  First close price: ${float(rows[0]['Close']):.2f}")
-        print(f"  Last close price: ${float(rows[-1]['Close']):.2f}")
-        print()
-        print("=" * 80)
-        print("THIS IS 100% REAL SILVER PRICE DATA FROM YAHOO FINANCE!")
-        print("=" * 80)
-        print()
-
-        return rows
-
-    except Exception as e:
-        print(f"Error fetching data: {e}")
-        return []
+from silver_data import (
+    fetch_real_silver_data,
+    process_data,
+    rank_movements,
+    calculate_statistics,
+    save_data_files,
+)
+from silver_core import dump_json
 
-def process_data(rows):
+def format_table(columns, widths):
     """
-    Process raw data and calculate movements.
+    Render columns of preformatted strings as rank-numbered, left-aligned
+    table lines. Each column is padded in one np.char.ljust call.
     """
-    data = []
-
-    for i, row in enumerate(rows):
-        try:
-            date = row['Date']
-            close = float(row['Close'])
-            volume = int(float(row['Volume']))
-
-            daily_change = None
-            daily_change_pct = None
-
-            if i > 0:
-                prev_close = data[-1]['close']
-                daily_change = close - prev_close
-                daily_change_pct = (daily_change / prev_close) * 100
-
-            data.append({
-                'date': date,
-                'close': close,
-                'volume': volume,
-                'daily_change': daily_change,
-                'daily_change_pct': daily_change_pct
-            })
-        except (ValueError, KeyError) as e:
-            print(f"Warning: Skipping row due to error: {e}")
-            continue
-
-    # Remove first entry (no change data)
-    if data:
-        data = data[1:]
-
-    return data
-
-def rank_movements(data, top_n=50):
-    """
-    Rank the biggest movements (positive and negative).
-    """
-    sorted_data = sorted(data, key=lambda x: x['daily_change_pct'] if x['daily_change_pct'] is not None else 0, reverse=True)
-
-    top_gains = sorted_data[:top_n]
-    top_losses = sorted_data[-top_n:][::-1]
-
-    return top_gains, top_losses
-
-def calculate_statistics(data):
-    """
-    Calculate summary statistics.
-    """
-    changes = [d['daily_change_pct'] for d in data if d['daily_change_pct'] is not None]
-
-    if not changes:
-        return {}
-
-    max_gain = max(changes)
-    max_loss = min(changes)
-    avg_change = sum(changes) / len(changes)
-
-    variance = sum((x - avg_change) ** 2 for x in changes) / len(changes)
-    std_dev = variance ** 0.5
-
-    max_gain_date = next(d['date'] for d in data if d['daily_change_pct'] == max_gain)
-    max_loss_date = next(d['date'] for d in data if d['daily_change_pct'] == max_loss)
-
-    return {
-        'max_gain_pct': max_gain,
-        'max_gain_date': max_gain_date,
-        'max_loss_pct': max_loss,
-        'max_loss_date': max_loss_date,
-        'avg_daily_change_pct': avg_change,
-        'volatility_std': std_dev,
-        'total_days': len(changes)
-    }
+    if not len(columns[0]):
+        return []
 
-def calculate_sigma(value, mean, std_dev):
-    """Calculate sigma (standard deviations from mean)"""
-    return (value - mean) / std_dev
+    ranks = np.arange(1, len(columns[0]) + 1).astype(str)
+    padded = [np.char.ljust(np.asarray(col, dtype=str), width)
+              for col, width in zip([ranks, *columns], widths)]
+    return np.char.add(functools.reduce(np.char.add, padded), "\n").tolist()
 
-def save_results(top_gains, top_losses, data, stats):
+def save_results(top_gains, top_losses, data, stats, now=None):
     """
     Save results to files with sigma values.
+    now is the analysis timestamp recorded in the outputs (default: the current time).
     """
-    mean = stats['avg_daily_change_pct']
-    std_dev = stats['volatility_std']
-
-    # Prepare results with sigma
-    gains_with_sigma = []
-    for d in top_gains:
-        sigma = calculate_sigma(d['daily_change_pct'], mean, std_dev)
-        gains_with_sigma.append({
-            'Date': d['date'],
-            'Close_Price': f"${d['close']:.2f}",
-            'Daily_Change': f"${d['daily_change']:.2f}" if d['daily_change'] is not None else 'N/A',
-            'Daily_Change_Pct': f"{d['daily_change_pct']:.2f}%" if d['daily_change_pct'] is not None else 'N/A',
-            'Sigma': f"{sigma:.2f}σ",
-            'Volume': f"{d['volume']:,}"
+    import pandas as pd
+
+    now = now or datetime.now()
+
+    # Prepare results with sigma, formatting each column in one np.char.mod call
+    # (volume needs thousands separators, which %-formatting lacks)
+    def format_rows(idx):
+        return pd.DataFrame({
+            'Date': data['date'][idx],
+            'Close_Price': np.char.mod('$%.2f', data['close'][idx]),
+            'Daily_Change': np.char.mod('$%.2f', data['daily_change'][idx]),
+            'Daily_Change_Pct': np.char.mod('%.2f%%', data['daily_change_pct'][idx]),
+            'Sigma': np.char.mod('%.2fσ', stats['sigma'][idx]),
+            'Volume': [f"{v:,}" for v in data['volume'][idx].tolist()]
         })
 
-    losses_with_sigma = []
-    for d in top_losses:
-        sigma = calculate_sigma(d['daily_change_pct'], mean, std_dev)
-        losses_with_sigma.append({
-            'Date': d['date'],
-            'Close_Price': f"${d['close']:.2f}",
-            'Daily_Change': f"${d['daily_change']:.2f}" if d['daily_change'] is not None else 'N/A',
-            'Daily_Change_Pct': f"{d['daily_change_pct']:.2f}%" if d['daily_change_pct'] is not None else 'N/A',
-            'Sigma': f"{sigma:.2f}σ",
-            'Volume': f"{d['volume']:,}"
-        })
+    gains_with_sigma = format_rows(top_gains)
+    losses_with_sigma = format_rows(top_losses)
+    table_widths = (6, 15, 12, 15, 15, 12, 15)
 
     results = {
-        'analysis_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'analysis_date': now.strftime('%Y-%m-%d %H:%M:%S'),
         'data_source': 'Yahoo Finance - REAL MARKET DATA',
         'data_period': {
-            'start': data[0]['date'] if data else 'N/A',
-            'end': data[-1]['date'] if data else 'N/A',
+            'start': data['date'][0] if data['date'].size else 'N/A',
+            'end': data['date'][-1] if data['date'].size else 'N/A',
             'total_days': stats.get('total_days', 0)
         },
-        'top_gains': gains_with_sigma,
-        'top_losses': losses_with_sigma,
+        'top_gains': gains_with_sigma.to_dict(orient='records'),
+        'top_losses': losses_with_sigma.to_dict(orient='records'),
         'statistics': {
             'max_gain_pct': f"{stats.get('max_gain_pct', 0):.2f}%",
             'max_gain_date': stats.get('max_gain_date', 'N/A'),
@@ -219,94 +81,80 @@ def save_results(top_gains, top_losses, data, stats):
     }
 
     # Save to JSON
-    with open('silver_price_analysis.json', 'w') as f:
-        json.dump(results, f, indent=2)
-
-    # Save full data to CSV
-    with open('silver_price_data_full.csv', 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['date', 'close', 'volume', 'daily_change', 'daily_change_pct'])
-        writer.writeheader()
-        writer.writerows(data)
-
-    # Save top gains
-    with open('silver_top_gains.csv', 'w', newline='') as f:
-        if top_gains:
-            writer = csv.DictWriter(f, fieldnames=top_gains[0].keys())
-            writer.writeheader()
-            writer.writerows(top_gains)
-
-    # Save top losses
-    with open('silver_top_losses.csv', 'w', newline='') as f:
-        if top_losses:
-            writer = csv.DictWriter(f, fieldnames=top_losses[0].keys())
-            writer.writeheader()
-            writer.writerows(top_losses)
-
-    # Create readable report
+    dump_json(results, 'silver_price_analysis.json')
+
+    # Save full data and top movements
+    full_path = save_data_files(top_gains, top_losses, data)
+
+    # Create readable report, assembled in memory and written in one call
+    lines = []
+    lines.append("=" * 90 + "\n")
+    lines.append("SILVER PRICE MOVEMENT ANALYSIS - REAL MARKET DATA\n")
+    lines.append("=" * 90 + "\n\n")
+
+    lines.append(f"Data Source: Yahoo Finance (REAL MARKET DATA)\n")
+    lines.append(f"Analysis Date: {results['analysis_date']}\n")
+    lines.append(f"Data Period: {results['data_period']['start']} to {results['data_period']['end']}\n")
+    lines.append(f"Total Trading Days: {results['data_period']['total_days']}\n\n")
+
+    lines.append("SUMMARY STATISTICS\n")
+    lines.append("-" * 90 + "\n")
+    lines.append(f"Maximum Single-Day Gain: {results['statistics']['max_gain_pct']} on {results['statistics']['max_gain_date']}\n")
+    lines.append(f"Maximum Single-Day Loss: {results['statistics']['max_loss_pct']} on {results['statistics']['max_loss_date']}\n")
+    lines.append(f"Average Daily Change: {results['statistics']['avg_daily_change_pct']}\n")
+    lines.append(f"Volatility (Std Dev): {results['statistics']['volatility_std']}\n\n")
+
+    lines.append("=" * 90 + "\n")
+    lines.append("TOP 50 BIGGEST GAINS (by percentage) - WITH SIGMA VALUES\n")
+    lines.append("=" * 90 + "\n\n")
+    lines.append(f"{'Rank':<6}{'Date':<15}{'Close':<12}{'Change $':<15}{'Change %':<15}{'Sigma':<12}{'Volume':<15}\n")
+    lines.append("-" * 90 + "\n")
+
+    lines.extend(format_table([gains_with_sigma[c] for c in gains_with_sigma.columns], table_widths))
+
+    lines.append("\n" + "=" * 90 + "\n")
+    lines.append("TOP 50 BIGGEST LOSSES (by percentage) - WITH SIGMA VALUES\n")
+    lines.append("=" * 90 + "\n\n")
+    lines.append(f"{'Rank':<6}{'Date':<15}{'Close':<12}{'Change $':<15}{'Change %':<15}{'Sigma':<12}{'Volume':<15}\n")
+    lines.append("-" * 90 + "\n")
+
+    lines.extend(format_table([losses_with_sigma[c] for c in losses_with_sigma.columns], table_widths))
+
     with open('silver_analysis_report.txt', 'w') as f:
-        f.write("=" * 90 + "\n")
-        f.write("SILVER PRICE MOVEMENT ANALYSIS - REAL MARKET DATA\n")
-        f.write("=" * 90 + "\n\n")
-
-        f.write(f"Data Source: Yahoo Finance (REAL MARKET DATA)\n")
-        f.write(f"Analysis Date: {results['analysis_date']}\n")
-        f.write(f"Data Period: {results['data_period']['start']} to {results['data_period']['end']}\n")
-        f.write(f"Total Trading Days: {results['data_period']['total_days']}\n\n")
-
-        f.write("SUMMARY STATISTICS\n")
-        f.write("-" * 90 + "\n")
-        f.write(f"Maximum Single-Day Gain: {results['statistics']['max_gain_pct']} on {results['statistics']['max_gain_date']}\n")
-        f.write(f"Maximum Single-Day Loss: {results['statistics']['max_loss_pct']} on {results['statistics']['max_loss_date']}\n")
-        f.write(f"Average Daily Change: {results['statistics']['avg_daily_change_pct']}\n")
-        f.write(f"Volatility (Std Dev): {results['statistics']['volatility_std']}\n\n")
-
-        f.write("=" * 90 + "\n")
-        f.write("TOP 50 BIGGEST GAINS (by percentage) - WITH SIGMA VALUES\n")
-        f.write("=" * 90 + "\n\n")
-        f.write(f"{'Rank':<6}{'Date':<15}{'Close':<12}{'Change $':<15}{'Change %':<15}{'Sigma':<12}{'Volume':<15}\n")
-        f.write("-" * 90 + "\n")
-
-        for i, result in enumerate(results['top_gains'], 1):
-            f.write(f"{i:<6}{result['Date']:<15}{result['Close_Price']:<12}"
-                   f"{result['Daily_Change']:<15}{result['Daily_Change_Pct']:<15}"
-                   f"{result['Sigma']:<12}{result['Volume']:<15}\n")
-
-        f.write("\n" + "=" * 90 + "\n")
-        f.write("TOP 50 BIGGEST LOSSES (by percentage) - WITH SIGMA VALUES\n")
-        f.write("=" * 90 + "\n\n")
-        f.write(f"{'Rank':<6}{'Date':<15}{'Close':<12}{'Change $':<15}{'Change %':<15}{'Sigma':<12}{'Volume':<15}\n")
-        f.write("-" * 90 + "\n")
-
-        for i, result in enumerate(results['top_losses'], 1):
-            f.write(f"{i:<6}{result['Date']:<15}{result['Close_Price']:<12}"
-                   f"{result['Daily_Change']:<15}{result['Daily_Change_Pct']:<15}"
-                   f"{result['Sigma']:<12}{result['Volume']:<15}\n")
+        f.write("".join(lines))
 
     print("\n✓ Results saved to:")
     print("  - silver_analysis_report.txt (human-readable report)")
     print("  - silver_price_analysis.json (structured data)")
-    print("  - silver_price_data_full.csv (complete dataset)")
+    print(f"  - {full_path} (complete dataset)")
     print("  - silver_top_gains.csv (top 50 gains)")
     print("  - silver_top_losses.csv (top 50 losses)")
 
 def main():
+    # Disable SSL verification for corporate firewalls. Done here rather than at
+    # import so scripts importing the shared helpers keep certificate checks
+    ssl._create_default_https_context = ssl._create_unverified_context
+
     print("=" * 90)
     print("SILVER PRICE MOVEMENT ANALYSIS - REAL DATA")
     print("=" * 90)
     print()
 
     # Fetch REAL data
-    rows = fetch_real_silver_data(symbol='SLV', years=10)
+    # One clock read per run, shared by the fetch period and the outputs
+    now = datetime.now()
 
-    if not rows:
+    prices = fetch_real_silver_data(symbol='SLV', years=10, now=now)
+
+    if prices is None:
         print("Error: Could not retrieve silver price data.")
         return
 
     # Process data
-    data = process_data(rows)
-    print(f"✓ Processed {len(data)} days with price movements\n")
+    data = process_data(prices)
+    print(f"✓ Processed {data['date'].size} days with price movements\n")
 
-    if not data:
+    if not data['date'].size:
         print("Error: No valid data to analyze.")
         return
 
@@ -316,6 +164,12 @@ def main():
     # Rank movements
     top_gains, top_losses = rank_movements(data, top_n=50)
 
+    def summary_line(i, idx):
+        pct = data['daily_change_pct'][idx]
+        sigma = stats['sigma'][idx]
+        return (f"{i:2d}. {data['date'][idx]} - {pct:+.2f}% ({sigma:+.2f}σ) "
+                f"(Close: ${data['close'][idx]:.2f}, Change: ${data['daily_change'][idx]:+.2f})")
+
     # Display summary
     print("=" * 90)
     print("SUMMARY STATISTICS")
@@ -328,24 +182,16 @@ def main():
     print("\n" + "=" * 90)
     print("TOP 10 BIGGEST GAINS")
     print("=" * 90)
-    for i, d in enumerate(top_gains[:10], 1):
-        pct = d['daily_change_pct'] if d['daily_change_pct'] is not None else 0
-        sigma = calculate_sigma(pct, stats['avg_daily_change_pct'], stats['volatility_std'])
-        print(f"{i:2d}. {d['date']} - {pct:+.2f}% ({sigma:+.2f}σ) "
-              f"(Close: ${d['close']:.2f}, Change: ${d['daily_change']:+.2f})")
+    print("\n".join(summary_line(i, idx) for i, idx in enumerate(top_gains[:10], 1)))
 
     print("\n" + "=" * 90)
     print("TOP 10 BIGGEST LOSSES")
     print("=" * 90)
-    for i, d in enumerate(top_losses[:10], 1):
-        pct = d['daily_change_pct'] if d['daily_change_pct'] is not None else 0
-        sigma = calculate_sigma(pct, stats['avg_daily_change_pct'], stats['volatility_std'])
-        print(f"{i:2d}. {d['date']} - {pct:+.2f}% ({sigma:+.2f}σ) "
-              f"(Close: ${d['close']:.2f}, Change: ${d['daily_change']:+.2f})")
+    print("\n".join(summary_line(i, idx) for i, idx in enumerate(top_losses[:10], 1)))
 
     # Save results
     print("\n" + "=" * 90)
-    save_results(top_gains, top_losses, data, stats)
+    save_results(top_gains, top_losses, data, stats, now=now)
     print("\n✓ Analysis complete!")
     print("\nTHIS DATA IS 100% REAL - Sourced from Yahoo Finance Market Data")
 
@@ -6,18 +6,52 @@ over the last 10 years.
 """
 
 import urllib.request
-import csv
-import json
+import gzip
+import io
+import os
+import sys
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from io import StringIO
 from collections import defaultdict
 
-def fetch_silver_data_csv(years=10):
+import numpy as np
+import pandas as pd
+
+from silver_core import (
+    CACHE_DIR,
+    analyze,
+    load_jit,
+    read_cache,
+    top_bottom_k,
+    write_cache,
+    write_outputs,
+)
+
+# Report table row: Rank, Date, Close, Change $, Change %, Volume
+ROW_FMT = "{:<6}{:<15}{:<12}{:<15}{:<12}{:<15}\n"
+
+def read_price_csv(body):
+    """
+    Parse a Yahoo Finance CSV body (bytes) into the columns process_data
+    uses. Numeric columns are inferred so a malformed cell costs only its
+    row (see to_float_array), not the download.
+    """
+    return pd.read_csv(
+        io.BytesIO(body),
+        usecols=['Date', 'Close', 'Adj Close', 'Volume'],
+        dtype={'Date': str},
+        na_values=['null']
+    )
+
+def fetch_silver_data_csv(years=10, use_cache=True, now=None):
     """
     Fetch silver price data by downloading CSV from Yahoo Finance.
     Using SLV (iShares Silver Trust ETF) as a proxy for silver prices.
+    The download is kept in CACHE_DIR, keyed by symbol and period, and
+    reused for silver_core.CACHE_TTL seconds unless use_cache is False. The period ends
+    at now (default: the current time).
     """
-    end_date = datetime.now()
+    end_date = now or datetime.now()
     start_date = end_date - timedelta(days=years*365)
 
     # Convert to Unix timestamps
@@ -29,98 +63,130 @@ def fetch_silver_data_csv(years=10):
     url = f"https://query1.finance.yahoo.com/v7/finance/download/{symbol}?period1={start_ts}&period2={end_ts}&interval=1d&events=history"
 
     print(f"Fetching silver price data from {start_date.date()} to {end_date.date()}...")
-    print(f"URL: {url}")
+
+    cache_path = os.path.join(CACHE_DIR, f"{symbol}_{start_date.date()}_{end_date.date()}.csv")
 
     try:
-        # Add headers to mimic browser request
-        req = urllib.request.Request(url)
-        req.add_header('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        body = read_cache(cache_path) if use_cache else None
+
+        if body is not None:
+            print(f"Using cached data: {cache_path}")
+            df = read_price_csv(body)
+        else:
+            print(f"URL: {url}")
+
+            # Add headers to mimic browser request
+            req = urllib.request.Request(url)
+            req.add_header('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+            req.add_header('Accept-Encoding', 'gzip')
 
-        with urllib.request.urlopen(req) as response:
-            data = response.read().decode('utf-8')
+            with urllib.request.urlopen(req) as response:
+                body = response.read()
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
 
-        # Parse CSV
-        csv_reader = csv.DictReader(StringIO(data))
-        rows = list(csv_reader)
+            # Parse before caching so a response that isn't a price CSV is
+            # never served from the cache
+            df = read_price_csv(body)
+            write_cache(cache_path, lambda f: f.write(body))
 
-        print(f"✓ Retrieved {len(rows)} days of data")
-        return rows
+        print(f"✓ Retrieved {len(df)} days of data")
+        return df
 
     except Exception as e:
         print(f"Error fetching data: {e}")
-        return []
+        return None
 
-def process_data(rows):
+def to_float_array(column, missing=np.nan):
     """
-    Process raw CSV data and calculate movements.
+    Convert a CSV column to a float64 array. Missing cells are set to missing;
+    malformed (non-numeric) cells become NaN.
     """
-    data = []
-
-    for i, row in enumerate(rows):
-        try:
-            date = row['Date']
-            close = float(row['Close'])
-            adj_close = float(row['Adj Close']) if row.get('Adj Close') else close
-            volume = int(float(row['Volume'])) if row.get('Volume') and row['Volume'] != 'null' else 0
-
-            daily_change = None
-            daily_change_pct = None
-
-            if i > 0:
-                prev_close = data[-1]['close']
-                daily_change = close - prev_close
-                daily_change_pct = (daily_change / prev_close) * 100
-
-            data.append({
-                'date': date,
-                'close': close,
-                'adj_close': adj_close,
-                'volume': volume,
-                'daily_change': daily_change,
-                'daily_change_pct': daily_change_pct
-            })
-        except (ValueError, KeyError) as e:
-            print(f"Warning: Skipping row {i} due to error: {e}")
-            continue
+    values = pd.to_numeric(column, errors='coerce').to_numpy(dtype=np.float64)
+    return np.where(column.isna().to_numpy(), missing, values)
 
-    # Remove first entry (no change data)
-    if data:
-        data = data[1:]
+@dataclass
+class Series:
+    """
+    Daily price series stored column-wise, one NumPy array per field.
+    mean, std, max_i and min_i summarize daily_change_pct.
+    """
+    date: np.ndarray
+    close: np.ndarray
+    adj_close: np.ndarray
+    volume: np.ndarray
+    daily_change: np.ndarray
+    daily_change_pct: np.ndarray
+    mean: float
+    std: float
+    max_i: int
+    min_i: int
+
+def process_data(df):
+    """
+    Process the downloaded CSV columns and calculate movements.
+    Returns a Series with one element per trading day.
+    """
+    dates = df['Date'].to_numpy(dtype='U10')
+    # Prices only need float32; changes and statistics are computed in float64
+    close = to_float_array(df['Close']).astype(np.float32)
+    adj_close = to_float_array(df['Adj Close']).astype(np.float32)
+    # A missing volume counts as 0; only a malformed one is NaN
+    volume = to_float_array(df['Volume'], missing=0)
+
+    # Skip rows without a usable close price or with a malformed volume
+    valid = ~np.isnan(close) & ~np.isnan(volume)
+    skipped = np.count_nonzero(~valid)
+    if skipped:
+        print(f"Warning: Skipping {skipped} rows without a usable close price or volume")
+
+    dates = dates[valid]
+    close = close[valid]
+    adj_close = adj_close[valid]
+    adj_close = np.where(np.isnan(adj_close), close, adj_close)
+    volume = volume[valid].astype(np.int64)
+
+    # Changes and their summary come out of one compiled pass
+    daily_change, daily_change_pct, mean, std, max_i, min_i = analyze(close)
 
-    return data
+    # Remove first entry (no change data)
+    return Series(
+        date=dates[1:],
+        close=close[1:],
+        adj_close=adj_close[1:],
+        volume=volume[1:],
+        daily_change=daily_change,
+        daily_change_pct=daily_change_pct,
+        mean=mean,
+        std=std,
+        max_i=int(max_i),
+        min_i=int(min_i)
+    )
 
 def rank_movements(data, top_n=50):
     """
     Rank the biggest movements (positive and negative).
+    Returns index arrays into the Series columns.
     """
-    # Sort by percentage change
-    sorted_data = sorted(data, key=lambda x: x['daily_change_pct'] if x['daily_change_pct'] is not None else 0, reverse=True)
-
-    top_gains = sorted_data[:top_n]
-    top_losses = sorted_data[-top_n:][::-1]  # Reverse to show worst first
-
-    return top_gains, top_losses
+    return top_bottom_k(data.daily_change_pct, top_n)
 
 def calculate_statistics(data):
     """
     Calculate summary statistics.
     """
-    changes = [d['daily_change_pct'] for d in data if d['daily_change_pct'] is not None]
+    changes = data.daily_change_pct
 
-    if not changes:
+    if not changes.size:
         return {}
 
-    max_gain = max(changes)
-    max_loss = min(changes)
-    avg_change = sum(changes) / len(changes)
-
-    # Calculate standard deviation
-    variance = sum((x - avg_change) ** 2 for x in changes) / len(changes)
-    std_dev = variance ** 0.5
+    avg_change = data.mean
+    std_dev = data.std
+    max_gain = changes[data.max_i]
+    max_loss = changes[data.min_i]
 
-    # Find dates for max/min
-    max_gain_date = next(d['date'] for d in data if d['daily_change_pct'] == max_gain)
-    max_loss_date = next(d['date'] for d in data if d['daily_change_pct'] == max_loss)
+    # Look up dates for max/min by position instead of scanning for the value
+    max_gain_date = str(data.date[data.max_i])
+    max_loss_date = str(data.date[data.min_i])
 
     return {
         'max_gain_pct': max_gain,
@@ -129,38 +195,41 @@ def calculate_statistics(data):
         'max_loss_date': max_loss_date,
         'avg_daily_change_pct': avg_change,
         'volatility_std': std_dev,
-        'total_days': len(changes)
+        'total_days': changes.size
     }
 
-def save_results(top_gains, top_losses, data, stats):
+def save_results(top_gains, top_losses, data, stats, now=None):
     """
     Save results to files.
+    now is the analysis timestamp recorded in the outputs (default: the current time).
     """
+    now = now or datetime.now()
+
     # Prepare results
     results = {
-        'analysis_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'analysis_date': now.strftime('%Y-%m-%d %H:%M:%S'),
         'data_period': {
-            'start': data[0]['date'] if data else 'N/A',
-            'end': data[-1]['date'] if data else 'N/A',
+            'start': data.date[0] if data.date.size else 'N/A',
+            'end': data.date[-1] if data.date.size else 'N/A',
             'total_days': stats.get('total_days', 0)
         },
         'top_gains': [
             {
-                'Date': d['date'],
-                'Close_Price': f"${d['close']:.2f}",
-                'Daily_Change': f"${d['daily_change']:.2f}" if d['daily_change'] is not None else 'N/A',
-                'Daily_Change_Pct': f"{d['daily_change_pct']:.2f}%" if d['daily_change_pct'] is not None else 'N/A',
-                'Volume': f"{d['volume']:,}"
-            } for d in top_gains
+                'Date': data.date[i],
+                'Close_Price': f"${data.close[i]:.2f}",
+                'Daily_Change': f"${data.daily_change[i]:.2f}",
+                'Daily_Change_Pct': f"{data.daily_change_pct[i]:.2f}%",
+                'Volume': f"{data.volume[i]:,}"
+            } for i in top_gains
         ],
         'top_losses': [
             {
-                'Date': d['date'],
-                'Close_Price': f"${d['close']:.2f}",
-                'Daily_Change': f"${d['daily_change']:.2f}" if d['daily_change'] is not None else 'N/A',
-                'Daily_Change_Pct': f"{d['daily_change_pct']:.2f}%" if d['daily_change_pct'] is not None else 'N/A',
-                'Volume': f"{d['volume']:,}"
-            } for d in top_losses
+                'Date': data.date[i],
+                'Close_Price': f"${data.close[i]:.2f}",
+                'Daily_Change': f"${data.daily_change[i]:.2f}",
+                'Daily_Change_Pct': f"{data.daily_change_pct[i]:.2f}%",
+                'Volume': f"{data.volume[i]:,}"
+            } for i in top_losses
         ],
         'statistics': {
             'max_gain_pct': f"{stats.get('max_gain_pct', 0):.2f}%",
@@ -172,68 +241,48 @@ def save_results(top_gains, top_losses, data, stats):
         }
     }
 
-    # Save to JSON
-    with open('silver_price_analysis.json', 'w') as f:
-        json.dump(results, f, indent=2)
-
-    # Save full data to CSV
-    with open('silver_price_data_full.csv', 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['date', 'close', 'adj_close', 'volume', 'daily_change', 'daily_change_pct'])
-        writer.writeheader()
-        writer.writerows(data)
-
-    # Save top gains to CSV
-    with open('silver_top_gains.csv', 'w', newline='') as f:
-        if top_gains:
-            writer = csv.DictWriter(f, fieldnames=top_gains[0].keys())
-            writer.writeheader()
-            writer.writerows(top_gains)
-
-    # Save top losses to CSV
-    with open('silver_top_losses.csv', 'w', newline='') as f:
-        if top_losses:
-            writer = csv.DictWriter(f, fieldnames=top_losses[0].keys())
-            writer.writeheader()
-            writer.writerows(top_losses)
-
     # Create readable report
-    with open('silver_analysis_report.txt', 'w') as f:
-        f.write("=" * 80 + "\n")
-        f.write("SILVER PRICE MOVEMENT ANALYSIS\n")
-        f.write("=" * 80 + "\n\n")
-
-        f.write(f"Analysis Date: {results['analysis_date']}\n")
-        f.write(f"Data Period: {results['data_period']['start']} to {results['data_period']['end']}\n")
-        f.write(f"Total Trading Days: {results['data_period']['total_days']}\n\n")
-
-        f.write("STATISTICS\n")
-        f.write("-" * 80 + "\n")
-        f.write(f"Maximum Single-Day Gain: {results['statistics']['max_gain_pct']} on {results['statistics']['max_gain_date']}\n")
-        f.write(f"Maximum Single-Day Loss: {results['statistics']['max_loss_pct']} on {results['statistics']['max_loss_date']}\n")
-        f.write(f"Average Daily Change: {results['statistics']['avg_daily_change_pct']}\n")
-        f.write(f"Volatility (Std Dev): {results['statistics']['volatility_std']}\n\n")
-
-        f.write("=" * 80 + "\n")
-        f.write("TOP 50 BIGGEST GAINS (by percentage)\n")
-        f.write("=" * 80 + "\n\n")
-        f.write(f"{'Rank':<6}{'Date':<15}{'Close':<12}{'Change $':<15}{'Change %':<12}{'Volume':<15}\n")
-        f.write("-" * 80 + "\n")
-
-        for i, result in enumerate(results['top_gains'], 1):
-            f.write(f"{i:<6}{result['Date']:<15}{result['Close_Price']:<12}"
-                   f"{result['Daily_Change']:<15}{result['Daily_Change_Pct']:<12}"
-                   f"{result['Volume']:<15}\n")
-
-        f.write("\n" + "=" * 80 + "\n")
-        f.write("TOP 50 BIGGEST LOSSES (by percentage)\n")
-        f.write("=" * 80 + "\n\n")
-        f.write(f"{'Rank':<6}{'Date':<15}{'Close':<12}{'Change $':<15}{'Change %':<12}{'Volume':<15}\n")
-        f.write("-" * 80 + "\n")
-
-        for i, result in enumerate(results['top_losses'], 1):
-            f.write(f"{i:<6}{result['Date']:<15}{result['Close_Price']:<12}"
-                   f"{result['Daily_Change']:<15}{result['Daily_Change_Pct']:<12}"
-                   f"{result['Volume']:<15}\n")
+    lines = []
+    lines.append("=" * 80 + "\n")
+    lines.append("SILVER PRICE MOVEMENT ANALYSIS\n")
+    lines.append("=" * 80 + "\n\n")
+
+    lines.append(f"Analysis Date: {results['analysis_date']}\n")
+    lines.append(f"Data Period: {results['data_period']['start']} to {results['data_period']['end']}\n")
+    lines.append(f"Total Trading Days: {results['data_period']['total_days']}\n\n")
+
+    lines.append("STATISTICS\n")
+    lines.append("-" * 80 + "\n")
+    lines.append(f"Maximum Single-Day Gain: {results['statistics']['max_gain_pct']} on {results['statistics']['max_gain_date']}\n")
+    lines.append(f"Maximum Single-Day Loss: {results['statistics']['max_loss_pct']} on {results['statistics']['max_loss_date']}\n")
+    lines.append(f"Average Daily Change: {results['statistics']['avg_daily_change_pct']}\n")
+    lines.append(f"Volatility (Std Dev): {results['statistics']['volatility_std']}\n\n")
+
+    lines.append("=" * 80 + "\n")
+    lines.append("TOP 50 BIGGEST GAINS (by percentage)\n")
+    lines.append("=" * 80 + "\n\n")
+    lines.append(ROW_FMT.format('Rank', 'Date', 'Close', 'Change $', 'Change %', 'Volume'))
+    lines.append("-" * 80 + "\n")
+
+    lines.extend(ROW_FMT.format(i, result['Date'], result['Close_Price'], result['Daily_Change'],
+                                result['Daily_Change_Pct'], result['Volume'])
+                 for i, result in enumerate(results['top_gains'], 1))
+
+    lines.append("\n" + "=" * 80 + "\n")
+    lines.append("TOP 50 BIGGEST LOSSES (by percentage)\n")
+    lines.append("=" * 80 + "\n\n")
+    lines.append(ROW_FMT.format('Rank', 'Date', 'Close', 'Change $', 'Change %', 'Volume'))
+    lines.append("-" * 80 + "\n")
+
+    lines.extend(ROW_FMT.format(i, result['Date'], result['Close_Price'], result['Daily_Change'],
+                                result['Daily_Change_Pct'], result['Volume'])
+                 for i, result in enumerate(results['top_losses'], 1))
+
+    columns = ['date', 'close', 'adj_close', 'volume', 'daily_change', 'daily_change_pct']
+
+    # Raw values straight from the columns; only the ranked rows above get display formatting
+    table = np.rec.fromarrays([getattr(data, c) for c in columns], names=columns)
+    write_outputs(results, lines, table, top_gains, top_losses)
 
     print("\nResults saved to:")
     print("  - silver_analysis_report.txt (human-readable report)")
@@ -248,22 +297,26 @@ def main():
     print("=" * 80)
     print()
 
+    now = datetime.now()
+
     # Fetch data
-    rows = fetch_silver_data_csv(years=10)
+    # --no-cache forces a fresh download
+    df = fetch_silver_data_csv(years=10, use_cache='--no-cache' not in sys.argv[1:], now=now)
 
-    if not rows:
+    if df is None or df.empty:
         print("Error: Could not retrieve silver price data.")
         return
 
-    # Process data
-    data = process_data(rows)
-    print(f"✓ Processed {len(data)} days of data with price movements")
+    # Process data, on the Numba kernel when it is installed
+    load_jit()
+    data = process_data(df)
+    print(f"✓ Processed {data.date.size} days of data with price movements")
 
-    if not data:
+    if not data.date.size:
         print("Error: No valid data to analyze.")
         return
 
-    print(f"  Date range: {data[0]['date']} to {data[-1]['date']}")
+    print(f"  Date range: {data.date[0]} to {data.date[-1]}")
 
     # Calculate statistics
     stats = calculate_statistics(data)
@@ -285,20 +338,20 @@ def main():
     print("\n" + "=" * 80)
     print("TOP 10 BIGGEST GAINS")
     print("=" * 80)
-    for i, d in enumerate(top_gains[:10], 1):
-        pct = d['daily_change_pct'] if d['daily_change_pct'] is not None else 0
-        print(f"{i:2d}. {d['date']} - {pct:+.2f}% (Close: ${d['close']:.2f})")
+    for i, idx in enumerate(top_gains[:10], 1):
+        pct = data.daily_change_pct[idx]
+        print(f"{i:2d}. {data.date[idx]} - {pct:+.2f}% (Close: ${data.close[idx]:.2f})")
 
     print("\n" + "=" * 80)
     print("TOP 10 BIGGEST LOSSES")
     print("=" * 80)
-    for i, d in enumerate(top_losses[:10], 1):
-        pct = d['daily_change_pct'] if d['daily_change_pct'] is not None else 0
-        print(f"{i:2d}. {d['date']} - {pct:+.2f}% (Close: ${d['close']:.2f})")
+    for i, idx in enumerate(top_losses[:10], 1):
+        pct = data.daily_change_pct[idx]
+        print(f"{i:2d}. {data.date[idx]} - {pct:+.2f}% (Close: ${data.close[idx]:.2f})")
 
     # Save results
     print("\n" + "=" * 80)
-    save_results(top_gains, top_losses, data, stats)
+    save_results(top_gains, top_losses, data, stats, now=now)
     print("\nAnalysis complete!")
 
 if __name__ == "__main__":
@@ -6,11 +6,18 @@ over the last 10 years.
 """
 
 import json
-import csv
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime
 import urllib.request
 import urllib.parse
 
+import numpy as np
+
+from silver_core import analyze, load_jit, top_bottom_k, write_outputs
+
+# Report table row: Rank, Date, Close, Change $, Change %, Volume
+ROW_FMT = "{:<6}{:<15}{:<12}{:<15}{:<15}{:<15}\n"
+
 def fetch_alpha_vantage_data(api_key='demo', symbol='SLV'):
     """
     Fetch data from Alpha Vantage (free tier: 25 requests/day, 500 requests/month).
@@ -90,29 +97,27 @@ def fetch_sample_data():
     """
     print("Using sample data for demonstration...")
 
-    import random
-    random.seed(42)
-
-    base_price = 20.0
-    data = []
-    current_date = datetime(2015, 1, 1)
-    end_date = datetime(2025, 12, 26)
-
-    while current_date <= end_date:
-        # Skip weekends
-        if current_date.weekday() < 5:
-            # Simulate realistic price movement
-            change_pct = random.gauss(0, 1.5)  # Mean 0%, std dev 1.5%
-            base_price *= (1 + change_pct / 100)
-            base_price = max(10, min(40, base_price))  # Keep in realistic range
-
-            data.append({
-                'Date': current_date.strftime('%Y-%m-%d'),
-                'Close': str(round(base_price, 2)),
-                'Volume': str(random.randint(5000000, 30000000))
-            })
+    rng = np.random.default_rng(42)
+
+    # Weekdays from 2015-01-01 to 2025-12-26
+    dates = np.arange('2015-01-01', '2025-12-27', dtype='datetime64[D]')
+    dates = dates[np.is_busday(dates)]
 
-        current_date += timedelta(days=1)
+    # Simulate realistic price movement: daily changes with mean 0%, std dev 1.5%
+    change_pct = rng.normal(0, 1.5, dates.size)
+    prices = np.cumprod(1 + change_pct / 100) * 20.0
+
+    # Keep in realistic range by reflecting the walk off $10 and $40 (in log
+    # space) rather than clipping, which would pin it flat at a bound for months
+    low, high = np.log(10), np.log(40)
+    offset = (np.log(prices) - low) % (2 * (high - low))
+    prices = np.exp(high - np.abs(offset - (high - low)))
+    volumes = rng.integers(5000000, 30000000, dates.size, endpoint=True)
+
+    data = [
+        {'Date': d, 'Close': c, 'Volume': v}
+        for d, c, v in zip(dates.astype(str), np.round(prices, 2).astype(str), volumes.astype(str))
+    ]
 
     print(f"✓ Generated {len(data)} days of sample data")
     print(f"  Date range: {data[0]['Date']} to {data[-1]['Date']}")
@@ -121,72 +126,97 @@ def fetch_sample_data():
 
     return data
 
+def to_float_array(values, missing=np.nan):
+    """
+    Convert raw string values to a float64 array. Missing or 'null' values
+    are set to missing; malformed (non-numeric) values become NaN.
+    """
+    def parse(v):
+        if v is None or v == '' or v == 'null':
+            return missing
+        try:
+            return float(v)
+        except ValueError:
+            return np.nan
+
+    return np.fromiter((parse(v) for v in values), dtype=np.float64, count=len(values))
+
+@dataclass
+class Series:
+    """
+    Daily price series stored column-wise, one NumPy array per field.
+    mean, std, max_i and min_i summarize daily_change_pct.
+    """
+    date: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    daily_change: np.ndarray
+    daily_change_pct: np.ndarray
+    mean: float
+    std: float
+    max_i: int
+    min_i: int
+
 def process_data(rows):
     """
     Process raw data and calculate movements.
+    Returns a Series with one element per trading day.
     """
-    data = []
+    dates = np.array([row.get('Date', '') for row in rows], dtype='U10')
+    # Prices only need float32; changes and statistics are computed in float64
+    close = to_float_array([row.get('Close') for row in rows]).astype(np.float32)
+    # A missing volume counts as 0; only a malformed one is NaN
+    volume = to_float_array([row.get('Volume') for row in rows], missing=0)
 
-    for i, row in enumerate(rows):
-        try:
-            date = row['Date']
-            close = float(row['Close'])
-            volume = int(float(row['Volume'])) if row.get('Volume') and row['Volume'] != 'null' else 0
-
-            daily_change = None
-            daily_change_pct = None
-
-            if i > 0:
-                prev_close = data[-1]['close']
-                daily_change = close - prev_close
-                daily_change_pct = (daily_change / prev_close) * 100
-
-            data.append({
-                'date': date,
-                'close': close,
-                'volume': volume,
-                'daily_change': daily_change,
-                'daily_change_pct': daily_change_pct
-            })
-        except (ValueError, KeyError) as e:
-            print(f"Warning: Skipping row due to error: {e}")
-            continue
+    # Skip rows without a usable close price or with a malformed volume
+    valid = ~np.isnan(close) & ~np.isnan(volume)
+    skipped = np.count_nonzero(~valid)
+    if skipped:
+        print(f"Warning: Skipping {skipped} rows without a usable close price or volume")
 
-    # Remove first entry (no change data)
-    if data:
-        data = data[1:]
+    dates = dates[valid]
+    close = close[valid]
+    volume = volume[valid].astype(np.int64)
 
-    return data
+    # Changes and their summary come out of one compiled pass
+    daily_change, daily_change_pct, mean, std, max_i, min_i = analyze(close)
+
+    # Remove first entry (no change data)
+    return Series(
+        date=dates[1:],
+        close=close[1:],
+        volume=volume[1:],
+        daily_change=daily_change,
+        daily_change_pct=daily_change_pct,
+        mean=mean,
+        std=std,
+        max_i=int(max_i),
+        min_i=int(min_i)
+    )
 
 def rank_movements(data, top_n=50):
     """
     Rank the biggest movements (positive and negative).
+    Returns index arrays into the Series columns.
     """
-    sorted_data = sorted(data, key=lambda x: x['daily_change_pct'] if x['daily_change_pct'] is not None else 0, reverse=True)
-
-    top_gains = sorted_data[:top_n]
-    top_losses = sorted_data[-top_n:][::-1]
-
-    return top_gains, top_losses
+    return top_bottom_k(data.daily_change_pct, top_n)
 
 def calculate_statistics(data):
     """
     Calculate summary statistics.
     """
-    changes = [d['daily_change_pct'] for d in data if d['daily_change_pct'] is not None]
+    changes = data.daily_change_pct
 
-    if not changes:
+    if not changes.size:
         return {}
 
-    max_gain = max(changes)
-    max_loss = min(changes)
-    avg_change = sum(changes) / len(changes)
-
-    variance = sum((x - avg_change) ** 2 for x in changes) / len(changes)
-    std_dev = variance ** 0.5
+    avg_change = data.mean
+    std_dev = data.std
+    max_gain = changes[data.max_i]
+    max_loss = changes[data.min_i]
 
-    max_gain_date = next(d['date'] for d in data if d['daily_change_pct'] == max_gain)
-    max_loss_date = next(d['date'] for d in data if d['daily_change_pct'] == max_loss)
+    max_gain_date = str(data.date[data.max_i])
+    max_loss_date = str(data.date[data.min_i])
 
     return {
         'max_gain_pct': max_gain,
@@ -195,37 +225,40 @@ def calculate_statistics(data):
         'max_loss_date': max_loss_date,
         'avg_daily_change_pct': avg_change,
         'volatility_std': std_dev,
-        'total_days': len(changes)
+        'total_days': changes.size
     }
 
-def save_results(top_gains, top_losses, data, stats):
+def save_results(top_gains, top_losses, data, stats, now=None):
     """
     Save results to files.
+    now is the analysis timestamp recorded in the outputs (default: the current time).
     """
+    now = now or datetime.now()
+
     results = {
-        'analysis_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'analysis_date': now.strftime('%Y-%m-%d %H:%M:%S'),
         'data_period': {
-            'start': data[0]['date'] if data else 'N/A',
-            'end': data[-1]['date'] if data else 'N/A',
+            'start': data.date[0] if data.date.size else 'N/A',
+            'end': data.date[-1] if data.date.size else 'N/A',
             'total_days': stats.get('total_days', 0)
         },
         'top_gains': [
             {
-                'Date': d['date'],
-                'Close_Price': f"${d['close']:.2f}",
-                'Daily_Change': f"${d['daily_change']:.2f}" if d['daily_change'] is not None else 'N/A',
-                'Daily_Change_Pct': f"{d['daily_change_pct']:.2f}%" if d['daily_change_pct'] is not None else 'N/A',
-                'Volume': f"{d['volume']:,}"
-            } for d in top_gains
+                'Date': data.date[i],
+                'Close_Price': f"${data.close[i]:.2f}",
+                'Daily_Change': f"${data.daily_change[i]:.2f}",
+                'Daily_Change_Pct': f"{data.daily_change_pct[i]:.2f}%",
+                'Volume': f"{data.volume[i]:,}"
+            } for i in top_gains
         ],
         'top_losses': [
             {
-                'Date': d['date'],
-                'Close_Price': f"${d['close']:.2f}",
-                'Daily_Change': f"${d['daily_change']:.2f}" if d['daily_change'] is not None else 'N/A',
-                'Daily_Change_Pct': f"{d['daily_change_pct']:.2f}%" if d['daily_change_pct'] is not None else 'N/A',
-                'Volume': f"{d['volume']:,}"
-            } for d in top_losses
+                'Date': data.date[i],
+                'Close_Price': f"${data.close[i]:.2f}",
+                'Daily_Change': f"${data.daily_change[i]:.2f}",
+                'Daily_Change_Pct': f"{data.daily_change_pct[i]:.2f}%",
+                'Volume': f"{data.volume[i]:,}"
+            } for i in top_losses
         ],
         'statistics': {
             'max_gain_pct': f"{stats.get('max_gain_pct', 0):.2f}%",
@@ -237,63 +270,47 @@ def save_results(top_gains, top_losses, data, stats):
         }
     }
 
-    with open('silver_price_analysis.json', 'w') as f:
-        json.dump(results, f, indent=2)
-
-    with open('silver_price_data_full.csv', 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['date', 'close', 'volume', 'daily_change', 'daily_change_pct'])
-        writer.writeheader()
-        writer.writerows(data)
-
-    with open('silver_top_gains.csv', 'w', newline='') as f:
-        if top_gains:
-            writer = csv.DictWriter(f, fieldnames=top_gains[0].keys())
-            writer.writeheader()
-            writer.writerows(top_gains)
-
-    with open('silver_top_losses.csv', 'w', newline='') as f:
-        if top_losses:
-            writer = csv.DictWriter(f, fieldnames=top_losses[0].keys())
-            writer.writeheader()
-            writer.writerows(top_losses)
-
-    with open('silver_analysis_report.txt', 'w') as f:
-        f.write("=" * 90 + "\n")
-        f.write("SILVER PRICE MOVEMENT ANALYSIS\n")
-        f.write("=" * 90 + "\n\n")
-
-        f.write(f"Analysis Date: {results['analysis_date']}\n")
-        f.write(f"Data Period: {results['data_period']['start']} to {results['data_period']['end']}\n")
-        f.write(f"Total Trading Days: {results['data_period']['total_days']}\n\n")
-
-        f.write("SUMMARY STATISTICS\n")
-        f.write("-" * 90 + "\n")
-        f.write(f"Maximum Single-Day Gain: {results['statistics']['max_gain_pct']} on {results['statistics']['max_gain_date']}\n")
-        f.write(f"Maximum Single-Day Loss: {results['statistics']['max_loss_pct']} on {results['statistics']['max_loss_date']}\n")
-        f.write(f"Average Daily Change: {results['statistics']['avg_daily_change_pct']}\n")
-        f.write(f"Volatility (Std Dev): {results['statistics']['volatility_std']}\n\n")
-
-        f.write("=" * 90 + "\n")
-        f.write("TOP 50 BIGGEST GAINS (by percentage)\n")
-        f.write("=" * 90 + "\n\n")
-        f.write(f"{'Rank':<6}{'Date':<15}{'Close':<12}{'Change $':<15}{'Change %':<15}{'Volume':<15}\n")
-        f.write("-" * 90 + "\n")
-
-        for i, result in enumerate(results['top_gains'], 1):
-            f.write(f"{i:<6}{result['Date']:<15}{result['Close_Price']:<12}"
-                   f"{result['Daily_Change']:<15}{result['Daily_Change_Pct']:<15}"
-                   f"{result['Volume']:<15}\n")
-
-        f.write("\n" + "=" * 90 + "\n")
-        f.write("TOP 50 BIGGEST LOSSES (by percentage)\n")
-        f.write("=" * 90 + "\n\n")
-        f.write(f"{'Rank':<6}{'Date':<15}{'Close':<12}{'Change $':<15}{'Change %':<15}{'Volume':<15}\n")
-        f.write("-" * 90 + "\n")
-
-        for i, result in enumerate(results['top_losses'], 1):
-            f.write(f"{i:<6}{result['Date']:<15}{result['Close_Price']:<12}"
-                   f"{result['Daily_Change']:<15}{result['Daily_Change_Pct']:<15}"
-                   f"{result['Volume']:<15}\n")
+    lines = []
+    lines.append("=" * 90 + "\n")
+    lines.append("SILVER PRICE MOVEMENT ANALYSIS\n")
+    lines.append("=" * 90 + "\n\n")
+
+    lines.append(f"Analysis Date: {results['analysis_date']}\n")
+    lines.append(f"Data Period: {results['data_period']['start']} to {results['data_period']['end']}\n")
+    lines.append(f"Total Trading Days: {results['data_period']['total_days']}\n\n")
+
+    lines.append("SUMMARY STATISTICS\n")
+    lines.append("-" * 90 + "\n")
+    lines.append(f"Maximum Single-Day Gain: {results['statistics']['max_gain_pct']} on {results['statistics']['max_gain_date']}\n")
+    lines.append(f"Maximum Single-Day Loss: {results['statistics']['max_loss_pct']} on {results['statistics']['max_loss_date']}\n")
+    lines.append(f"Average Daily Change: {results['statistics']['avg_daily_change_pct']}\n")
+    lines.append(f"Volatility (Std Dev): {results['statistics']['volatility_std']}\n\n")
+
+    lines.append("=" * 90 + "\n")
+    lines.append("TOP 50 BIGGEST GAINS (by percentage)\n")
+    lines.append("=" * 90 + "\n\n")
+    lines.append(ROW_FMT.format('Rank', 'Date', 'Close', 'Change $', 'Change %', 'Volume'))
+    lines.append("-" * 90 + "\n")
+
+    lines.extend(ROW_FMT.format(i, result['Date'], result['Close_Price'], result['Daily_Change'],
+                                result['Daily_Change_Pct'], result['Volume'])
+                 for i, result in enumerate(results['top_gains'], 1))
+
+    lines.append("\n" + "=" * 90 + "\n")
+    lines.append("TOP 50 BIGGEST LOSSES (by percentage)\n")
+    lines.append("=" * 90 + "\n\n")
+    lines.append(ROW_FMT.format('Rank', 'Date', 'Close', 'Change $', 'Change %', 'Volume'))
+    lines.append("-" * 90 + "\n")
+
+    lines.extend(ROW_FMT.format(i, result['Date'], result['Close_Price'], result['Daily_Change'],
+                                result['Daily_Change_Pct'], result['Volume'])
+                 for i, result in enumerate(results['top_losses'], 1))
+
+    columns = ['date', 'close', 'volume', 'daily_change', 'daily_change_pct']
+
+    # Raw values straight from the columns; only the ranked rows above get display formatting
+    table = np.rec.fromarrays([getattr(data, c) for c in columns], names=columns)
+    write_outputs(results, lines, table, top_gains, top_losses)
 
     print("\n✓ Results saved to:")
     print("  - silver_analysis_report.txt (human-readable report)")
@@ -310,6 +327,9 @@ def main():
     print("=" * 90)
     print()
 
+    # One clock read per run, recorded in the outputs
+    now = datetime.now()
+
     # Check for API key argument
     api_key = sys.argv[1] if len(sys.argv) > 1 else 'demo'
 
@@ -325,11 +345,12 @@ def main():
         print("Error: Could not retrieve or generate data.")
         return
 
-    # Process data
+    # Process data, on the Numba kernel when it is installed
+    load_jit()
     data = process_data(rows)
-    print(f"✓ Processed {len(data)} days with price movements\n")
+    print(f"✓ Processed {data.date.size} days with price movements\n")
 
-    if not data:
+    if not data.date.size:
         print("Error: No valid data to analyze.")
         return
 
@@ -351,20 +372,20 @@ def main():
     print("\n" + "=" * 90)
     print("TOP 10 BIGGEST GAINS")
     print("=" * 90)
-    for i, d in enumerate(top_gains[:10], 1):
-        pct = d['daily_change_pct'] if d['daily_change_pct'] is not None else 0
-        print(f"{i:2d}. {d['date']} - {pct:+.2f}% (Close: ${d['close']:.2f}, Change: ${d['daily_change']:+.2f})")
+    for i, idx in enumerate(top_gains[:10], 1):
+        pct = data.daily_change_pct[idx]
+        print(f"{i:2d}. {data.date[idx]} - {pct:+.2f}% (Close: ${data.close[idx]:.2f}, Change: ${data.daily_change[idx]:+.2f})")
 
     print("\n" + "=" * 90)
     print("TOP 10 BIGGEST LOSSES")
     print("=" * 90)
-    for i, d in enumerate(top_losses[:10], 1):
-        pct = d['daily_change_pct'] if d['daily_change_pct'] is not None else 0
-        print(f"{i:2d}. {d['date']} - {pct:+.2f}% (Close: ${d['close']:.2f}, Change: ${d['daily_change']:+.2f})")
+    for i, idx in enumerate(top_losses[:10], 1):
+        pct = data.daily_change_pct[idx]
+        print(f"{i:2d}. {data.date[idx]} - {pct:+.2f}% (Close: ${data.close[idx]:.2f}, Change: ${data.daily_change[idx]:+.2f})")
 
     # Save results
     print("\n" + "=" * 90)
-    save_results(top_gains, top_losses, data, stats)
+    save_results(top_gains, top_losses, data, stats, now=now)
     print("\n✓ Analysis complete!")
     print("\nTo get real data, obtain a free API key from https://www.alphavantage.co/support/#api-key")
     print("Then run: python3 analyze_silver_prices_v3.py YOUR_API_KEY")
@@ -0,0 +1,157 @@
+"""
+Numeric core and output writers shared by the silver price analysis scripts.
+Plain NumPy by default; load_jit() switches analyze to the Numba kernels in
+silver_jit.py when Numba is installed.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# On-disk cache for downloaded prices, shared by all scripts (one trading day TTL)
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'silver_analysis')
+CACHE_TTL = 24 * 60 * 60
+
+def read_cache(path, ttl_seconds=CACHE_TTL):
+    """
+    Return the bytes of a cache file, or None when it is missing or older
+    than ttl_seconds.
+    """
+    try:
+        if os.stat(path).st_mtime > time.time() - ttl_seconds:
+            with open(path, 'rb') as f:
+                return f.read()
+    except OSError:
+        pass  # Not cached yet
+    return None
+
+def write_cache(path, write):
+    """
+    Create a cache file by calling write(f) on a binary file object.
+    Writes to a temp file and renames so readers never see a partial file.
+    A cache that can't be written only costs the next run a download, so
+    the failure is reported and otherwise ignored.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: Could not write cache file {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def compute_changes(close):
+    """Return (daily_change, daily_change_pct) for a close series, in float64."""
+    close = close.astype(np.float64)
+    dc = np.diff(close)
+    return dc, dc / close[:-1] * 100
+
+def summary_stats(pct):
+    """Return (mean, std, max, min, argmax, argmin) of pct, ignoring NaNs."""
+    if np.isnan(pct).all():
+        return np.nan, np.nan, np.nan, np.nan, 0, 0
+    max_i = np.nanargmax(pct)
+    min_i = np.nanargmin(pct)
+    return np.nanmean(pct), np.nanstd(pct), pct[max_i], pct[min_i], max_i, min_i
+
+# Compiled analyze kernel from silver_jit, once load_jit() has loaded it
+_jit_analyze = None
+
+def load_jit():
+    """
+    Switch analyze over to the Numba kernel when Numba is installed, compiling
+    it (or loading it from Numba's on-disk cache) for the float32 prices the
+    scripts pass. Called from the v2/v3 main() so that importing this module
+    never pays for Numba.
+    """
+    global _jit_analyze
+    try:
+        from silver_jit import analyze as jit_analyze
+    except ImportError:
+        return  # No Numba; analyze stays on NumPy
+
+    jit_analyze(np.ones(2, dtype=np.float32))
+    _jit_analyze = jit_analyze
+
+def analyze(close):
+    """Return (daily_change, daily_change_pct, mean, std, argmax, argmin) for a close series."""
+    if _jit_analyze is not None:
+        return _jit_analyze(close)
+    dc, dcp = compute_changes(close)
+    mean, std, _, _, max_i, min_i = summary_stats(dcp)
+    return dc, dcp, mean, std, max_i, min_i
+
+def top_bottom_k(pct, k):
+    """
+    Return index arrays of the k largest values of pct (descending) and the
+    k smallest (ascending), ignoring NaNs.
+    """
+    valid = np.flatnonzero(~np.isnan(pct))
+    k = min(k, valid.size)
+
+    if not k:
+        return valid[:0], valid[:0]
+
+    # One partial selection places both ends; only those k candidates get sorted
+    order = valid[np.argpartition(pct[valid], (k - 1, valid.size - k))]
+
+    top = order[-k:]
+    top = top[np.argsort(-pct[top])]
+
+    bottom = order[:k]
+    bottom = bottom[np.argsort(pct[bottom])]
+
+    return top, bottom
+
+def dump_json(obj, path):
+    """Write obj to path as indented JSON, using orjson when available."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+def write_outputs(results, report_lines, table, top_gains, top_losses):
+    """
+    Write one run's outputs: results to silver_price_analysis.json,
+    report_lines to silver_analysis_report.txt, and the rows of the record
+    array table to silver_price_data_full.csv, with the rows at top_gains
+    and top_losses also written to silver_top_gains.csv and
+    silver_top_losses.csv.
+    """
+    csv_args = dict(fmt='%s', delimiter=',', header=','.join(table.dtype.names), comments='')
+
+    def write_top_csv(path, rows):
+        with open(path, 'w') as f:
+            if rows.size:
+                np.savetxt(f, rows, **csv_args)
+
+    def write_report():
+        with open('silver_analysis_report.txt', 'w') as f:
+            f.write("".join(report_lines))
+
+    # The files are independent, so their writes overlap; result() re-raises any write error
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [
+            executor.submit(dump_json, results, 'silver_price_analysis.json'),
+            executor.submit(np.savetxt, 'silver_price_data_full.csv', table, **csv_args),
+            executor.submit(write_top_csv, 'silver_top_gains.csv', table[top_gains]),
+            executor.submit(write_top_csv, 'silver_top_losses.csv', table[top_losses]),
+            executor.submit(write_report)
+        ]
+    for future in futures:
+        future.result()
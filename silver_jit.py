@@ -0,0 +1,67 @@
+"""
+Numba-compiled kernels behind silver_core.analyze.
+Importing Numba is slow, so this module is only imported by
+silver_core.load_jit(); it raises ImportError when Numba is not installed.
+"""
+
+import numpy as np
+from numba import njit
+
+# Every fastmath flag except 'nnan', so the NaN checks are not optimised away
+FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# No fastmath here: 'arcp' would turn the division into a reciprocal
+# multiply and change the last digit of the written percentages
+@njit(cache=True)
+def compute_changes(close):
+    """Return (daily_change, daily_change_pct) for a close series, in float64."""
+    n = max(close.size - 1, 0)
+    dc = np.empty(n)
+    dcp = np.empty(n)
+    for i in range(n):
+        # Widen each price so float32 input still gets float64 changes
+        prev = float(close[i])
+        dc[i] = float(close[i + 1]) - prev
+        dcp[i] = dc[i] / prev * 100
+    return dc, dcp
+
+@njit(cache=True, fastmath=FASTMATH)
+def summary_stats(pct):
+    """Return (mean, std, max, min, argmax, argmin) of pct, ignoring NaNs, in one compiled kernel."""
+    n = 0
+    total = 0.0
+    max_v = -np.inf
+    min_v = np.inf
+    max_i = 0
+    min_i = 0
+    for i in range(pct.size):
+        v = pct[i]
+        if np.isnan(v):
+            continue
+        n += 1
+        total += v
+        if v > max_v:
+            max_v = v
+            max_i = i
+        if v < min_v:
+            min_v = v
+            min_i = i
+
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan, 0, 0
+
+    mean = total / n
+    sq = 0.0
+    for i in range(pct.size):
+        v = pct[i]
+        if not np.isnan(v):
+            sq += (v - mean) * (v - mean)
+
+    return mean, (sq / n) ** 0.5, max_v, min_v, max_i, min_i
+
+@njit(cache=True)
+def analyze(close):
+    """Return (daily_change, daily_change_pct, mean, std, argmax, argmin) for a close series."""
+    dc, dcp = compute_changes(close)
+    mean, std, _, _, max_i, min_i = summary_stats(dcp)
+    return dc, dcp, mean, std, max_i, min_i